@@ -4,16 +4,20 @@ import json
 import os
 from datetime import datetime
 import re
+import tempfile
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import gspread
 from google.oauth2.service_account import Credentials
 from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from gspread.utils import DateTimeOption, ValueRenderOption, a1_to_rowcol, absolute_range_name
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
 from zipfile import ZipFile
-from io import BytesIO
 
 from extractores.sicep import login_and_scrape  # Asegúrate de que este módulo está correctamente implementado y accesible
 
@@ -35,6 +39,11 @@ CREDENTIALS_ENV_VAR = "GOOGLE_APPLICATION_CREDENTIALS_JSON"
 # URLs Configuration
 BASE_URL = "https://transparenciachc.blob.core.windows.net/lic-da/"
 
+# Sesión compartida para las descargas mensuales: reutiliza las conexiones TLS al blob.
+# El pool de urllib3 es seguro entre hilos y hay a lo sumo dos descargas simultáneas.
+DESCARGAS_SESSION = requests.Session()
+DESCARGAS_SESSION.mount('https://', HTTPAdapter(pool_maxsize=2))
+
 # Health-Related Organizations to Exclude
 SALUD_EXCLUIR = [
     'CENTRO DE SALUD', 'PREHOSPITALARIA', 'REFERENCIA DE SALUD',
@@ -46,6 +55,20 @@ SALUD_EXCLUIR = [
     'SERV NAC SALUD', 'SERV SALUD', 'SERVICIO DE SALUD',
     'SERVICIO NACIONAL DE SALUD', 'SERVICIO SALUD', 'INSTITUTO DE DESARROLLO AGROPECUARIO'
 ]
+SALUD_EXCLUIR_REGEX = re.compile('|'.join(re.escape(termino) for termino in SALUD_EXCLUIR), re.IGNORECASE)
+
+# Normalización de texto: marcas diacríticas combinantes (tras NFD) y espacios repetidos
+DIACRITICOS_REGEX = re.compile('[\u0300-\u036f]')
+ESPACIOS_REGEX = re.compile(r'\s+')
+
+# Columnas de texto que se normalizan antes de calcular puntajes
+COLUMNAS_TEXTO = ['Nombre', 'Descripcion', 'Rubro3', 'Nombre producto genrico', 'NombreOrganismo']
+
+# Nombres de las hojas de configuración
+HOJA_INICIO = 'Inicio'
+HOJA_CLIENTES = 'Clientes'
+HOJA_LISTA_NEGRA = 'LNegra Palabras'
+HOJA_SELECCION = 'Selección'
 
 # Lista Negra (Blacklist) Configuration
 LISTA_NEGRA_RANGE = 'B2:B'
@@ -67,6 +90,26 @@ PRODUCTOS_RANGES = {
     'rubro2': [f'G{row}' for row in range(14, 24)],
     'rubro3': [f'J{row}' for row in range(14, 24)]
 }
+# Bloque que contiene todas las celdas de RUBROS_RANGES y PRODUCTOS_RANGES
+RUBROS_PRODUCTOS_RANGE = 'C13:J23'
+PONDERACIONES_RANGES = {
+    'Puntaje Rubro': 'K11',
+    'Puntaje Palabra': 'K25',
+    'Puntaje Clientes': 'K39',
+    'Puntaje Monto': 'K43'
+}
+CLIENTES_RANGE = 'D4:E'
+SELECCION_RANGE = 'A4:A'
+
+# Rangos de configuración que se leen juntos en una sola llamada values.batchGet
+RANGOS_CONFIGURACION = (
+    [(HOJA_INICIO, FECHAS_RANGE)]
+    + [(HOJA_INICIO, celda) for celda in PONDERACIONES_RANGES.values()]
+    + [(HOJA_INICIO, rango) for rango in PALABRAS_CLAVE_RANGES.values()]
+    + [(HOJA_INICIO, RUBROS_PRODUCTOS_RANGE)]
+    + [(HOJA_CLIENTES, CLIENTES_RANGE), (HOJA_LISTA_NEGRA, LISTA_NEGRA_RANGE)]
+    + [(HOJA_SELECCION, SELECCION_RANGE)]
+)
 
 # Column Configuration
 COLUMNAS_IMPORTANTES = [
@@ -74,6 +117,60 @@ COLUMNAS_IMPORTANTES = [
     'Tipo', 'CantidadReclamos', 'TiempoDuracionContrato', 'Link', 'CodigoProductoONU'
 ]
 
+# Monto base por tipo de licitación, usado en el puntaje por monto
+MONTOS_POR_TIPO = {
+    'L1': 0, 'LE': 100, 'LP': 1000, 'LQ': 2000, 'LR': 5000, 'LS': 0,
+    'E2': 0, 'CO': 100, 'B2': 1000, 'H2': 2000, 'I2': 5000
+}
+
+# Tipos explícitos de las columnas de texto del CSV, para no inferirlos bloque a bloque
+CSV_DTYPES = {
+    col: str for col in COLUMNAS_IMPORTANTES
+    if col not in ('CantidadReclamos', 'TiempoDuracionContrato')
+}
+
+# Tamaño máximo (bytes) que un ZIP descargado ocupa en memoria antes de pasar a disco
+ZIP_SPOOL_MAX_SIZE = 50 * 1024 * 1024
+
+# Filas por bloque al leer los CSV de Mercado Público
+CSV_CHUNKSIZE = 50_000
+
+# Hilos para parsear en paralelo los CSV de un mismo ZIP
+CSV_MAX_WORKERS = 4
+
+# Columnas de puntaje y sus equivalentes relativos, en el mismo orden que las ponderaciones
+COLUMNAS_PUNTAJE = ['Puntaje Rubro', 'Puntaje Palabra', 'Puntaje Monto', 'Puntaje Clientes']
+COLUMNAS_PUNTAJE_RELATIVO = [
+    'Puntaje Relativo Rubro', 'Puntaje Relativo Palabra', 'Puntaje Relativo Monto', 'Puntaje Relativo Clientes'
+]
+
+# Columnas de fecha y formato (ISO) con el que se escriben en las hojas
+COLUMNAS_FECHA = ['FechaPublicacion', 'FechaCierre']
+FORMATO_FECHA_HOJA = '%Y-%m-%dT%H:%M:%S'
+
+# Nombres con los que se publican los puntajes en la Hoja 2 y orden de sus columnas
+RENOMBRE_RANKING = {
+    'Puntaje Relativo Rubro': 'Rubro',
+    'Puntaje Relativo Palabra': 'Palabra',
+    'Puntaje Relativo Monto': 'Monto',
+    'Puntaje Relativo Clientes': 'Clientes',
+    'Puntaje Total SUMAPRODUCTO': 'Puntaje Final'
+}
+COLUMNAS_RANKING = [
+    '#', 'CodigoExterno', 'Nombre', 'Descripcion', 'NombreOrganismo', 'FechaPublicacion', 'FechaCierre', 'Estado', 'ObservacionContrato', 'TiempoDuracionContrato', 'Link',
+    'Rubro', 'Palabra', 'Monto', 'Clientes', 'Puntaje Final'
+]
+COLUMNAS_RANKING_REDONDEO = ['Palabra', 'Monto', 'Puntaje Final']
+
+# Columnas numéricas que se convierten al construir un DataFrame desde una hoja
+COLUMNAS_NUMERICAS = ['CantidadReclamos', 'TiempoDuracionContrato']
+
+# Columnas de texto repetitivo que se convierten a 'category' antes de agrupar
+COLUMNAS_CATEGORICAS = ['CodigoExterno', 'Tipo', 'NombreOrganismo']
+
+# Columnas repetitivas de las licitaciones descargadas que se guardan como 'category'
+COLUMNAS_CATEGORICAS_DESCARGA = COLUMNAS_CATEGORICAS + ['Rubro3']
+
 # -------------------------- Logging Setup --------------------------
 
 def setup_logging():
@@ -90,21 +187,45 @@ def setup_logging():
 
 # -------------------------- Serialization Function --------------------------
 
-def serialize_value(x):
+def formatear_fechas_iso(fechas):
     """
-    Convierte objetos no serializables a un formato serializable.
-    
+    Formatea una columna datetime igual que `Timestamp.isoformat()`, pero por columna.
+
+    El caso habitual (sin zona horaria ni fracciones de segundo) se resuelve con un solo
+    `dt.strftime`; solo las fechas con fracciones o zona horaria se formatean una a una.
+
     Args:
-        x: El valor a serializar.
-    
+        fechas (pd.Series): Columna datetime64, con o sin zona horaria.
+
     Returns:
-        El valor serializado.
+        pd.Series: Las fechas como texto ISO; los nulos se mantienen.
+    """
+    if fechas.dt.tz is not None:
+        return fechas.map(lambda fecha: fecha.isoformat() if pd.notna(fecha) else fecha)
+    texto = fechas.dt.strftime(FORMATO_FECHA_HOJA)
+    con_fraccion = fechas.notna() & ((fechas.dt.microsecond != 0) | (fechas.dt.nanosecond != 0))
+    if con_fraccion.any():
+        texto = texto.mask(con_fraccion, fechas[con_fraccion].map(pd.Timestamp.isoformat))
+    return texto
+
+def dataframe_a_valores(df):
     """
-    if pd.isnull(x):
-        return ''
-    if isinstance(x, (pd.Timestamp, datetime)):
-        return x.isoformat()
-    return x
+    Convierte un DataFrame en una lista de listas serializable, con la cabecera en la primera fila.
+
+    La conversión se hace por columna en lugar de celda a celda: las fechas se formatean
+    en ISO, los valores nulos pasan a '' y los números se mantienen como números.
+
+    Args:
+        df (pd.DataFrame): El DataFrame a convertir.
+
+    Returns:
+        list: Lista de listas lista para subir a Google Sheets.
+    """
+    df = df.copy()
+    for col in df.select_dtypes(include=['datetime', 'datetimetz']).columns:
+        df[col] = formatear_fechas_iso(df[col])
+    valores = df.astype(object).where(df.notna(), '')
+    return [df.columns.tolist()] + valores.to_numpy().tolist()
 
 # -------------------------- Google Sheets Authentication --------------------------
 
@@ -124,6 +245,11 @@ def authenticate_google_sheets():
         creds_info = json.loads(creds_json)
         creds = Credentials.from_service_account_info(creds_info, scopes=SCOPES)
         gc = gspread.authorize(creds)
+        # El adaptador solo agranda el pool de conexiones; los reintentos quedan en los decoradores @retry
+        gc.http_client.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        )
         logging.info("Autenticación con Google Sheets exitosa.")
         return gc
     except json.JSONDecodeError as e:
@@ -140,31 +266,46 @@ def authenticate_google_sheets():
     stop=stop_after_attempt(5),
     retry=retry_if_exception_type(APIError)
 )
-def get_worksheet_with_retry(spreadsheet, nombre):
+def obtener_hojas(spreadsheet):
     """
-    Retrieves a worksheet by name with retry mechanism for handling API errors.
+    Retrieves every worksheet of the spreadsheet with a single metadata request.
 
     Args:
         spreadsheet (gspread.Spreadsheet): The spreadsheet object.
-        nombre (str): The name of the worksheet to retrieve.
 
     Returns:
-        gspread.Worksheet: The retrieved worksheet.
+        dict: A dictionary mapping worksheet titles to their gspread.Worksheet.
     """
     try:
-        worksheet = spreadsheet.worksheet(nombre)
-        logging.info(f"Hoja '{nombre}' obtenida exitosamente.")
-        return worksheet
-    except WorksheetNotFound as e:
-        logging.error(f"Hoja '{nombre}' no encontrada: {e}")
-        raise
+        hojas = {worksheet.title: worksheet for worksheet in spreadsheet.worksheets()}
+        logging.info(f"Hojas obtenidas en una sola llamada: {list(hojas)}")
+        return hojas
     except APIError as e:
-        logging.warning(f"APIError al obtener Hoja '{nombre}': {e}. Reintentando...")
+        logging.warning(f"APIError al obtener las hojas: {e}. Reintentando...")
         raise
     except Exception as e:
-        logging.error(f"Error inesperado al obtener Hoja '{nombre}': {e}", exc_info=True)
+        logging.error(f"Error inesperado al obtener las hojas: {e}", exc_info=True)
         raise
 
+def buscar_hoja(hojas, nombre):
+    """
+    Looks up a worksheet by name among those returned by `obtener_hojas`.
+
+    Args:
+        hojas (dict): A dictionary mapping worksheet titles to worksheets.
+        nombre (str): The name of the worksheet to retrieve.
+
+    Returns:
+        gspread.Worksheet: The retrieved worksheet.
+
+    Raises:
+        WorksheetNotFound: If no worksheet has that name.
+    """
+    if nombre not in hojas:
+        logging.error(f"Hoja '{nombre}' no encontrada.")
+        raise WorksheetNotFound(nombre)
+    return hojas[nombre]
+
 # -------------------------- Utility Functions --------------------------
 
 def eliminar_tildes_y_normalizar(texto):
@@ -178,95 +319,238 @@ def eliminar_tildes_y_normalizar(texto):
         str: El texto sin tildes, sin espacios extra y en minúsculas.
     """
     if texto and isinstance(texto, str):
-        texto = unicodedata.normalize('NFD', texto)
-        texto = ''.join(char for char in texto if unicodedata.category(char) != 'Mn')
-        texto = re.sub(r'\s+', ' ', texto)  # Eliminar espacios adicionales
+        texto = DIACRITICOS_REGEX.sub('', unicodedata.normalize('NFD', texto))
+        texto = ESPACIOS_REGEX.sub(' ', texto)  # Eliminar espacios adicionales
         texto = texto.strip().lower()
     return texto
 
-def obtener_rango_hoja(worksheet, rango):
+def normalizar_serie(serie):
+    """
+    Versión vectorizada de `eliminar_tildes_y_normalizar` para una columna completa.
+
+    Los valores que no son texto (nulos, números) se devuelven sin cambios. En columnas
+    'category' se normaliza una sola vez cada categoría.
+
+    Args:
+        serie (pd.Series): La columna a normalizar.
+
+    Returns:
+        pd.Series: La columna sin tildes, sin espacios extra y en minúsculas.
+    """
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        categorias = pd.Series(serie.cat.categories, dtype=object)
+        normalizadas = normalizar_serie(categorias)
+        return serie.astype(object).map(dict(zip(categorias, normalizadas)))
+    if not (pd.api.types.is_object_dtype(serie) or pd.api.types.is_string_dtype(serie)):
+        return serie
+    texto = (
+        serie.str.normalize('NFD')
+        .str.replace(DIACRITICOS_REGEX, '', regex=True)
+        .str.replace(ESPACIOS_REGEX, ' ', regex=True)
+        .str.strip()
+        .str.lower()
+    )
+    return texto.where(texto.notna(), serie)
+
+def normalizar_codigos_producto(serie):
+    """
+    Normaliza la columna 'CodigoProductoONU' descartando la parte decimal de los códigos.
+
+    Args:
+        serie (pd.Series): La columna de códigos de producto.
+
+    Returns:
+        pd.Series: Los códigos normalizados; los valores nulos se mantienen.
+    """
+    codigos = normalizar_serie(serie.astype(str).str.split('.', n=1).str[0])
+    return codigos.where(serie.notna(), serie)
+
+def mascara_organismos_salud(nombres, regex):
+    """
+    Identifica los organismos de salud a excluir evaluando el patrón una sola vez por nombre distinto.
+
+    Args:
+        nombres (pd.Series): Nombres de organismos, uno por licitación.
+        regex (re.Pattern): Patrón compilado con los términos de exclusión.
+
+    Returns:
+        pd.Series: Máscara booleana alineada con `nombres`, True para los organismos de salud.
+    """
+    nombres_unicos = pd.Series(nombres.dropna().unique())
+    nombres_salud = nombres_unicos[nombres_unicos.astype(str).str.contains(regex, na=False)]
+    return nombres.isin(nombres_salud)
+
+def valores_a_dataframe(valores):
+    """
+    Construye un DataFrame a partir de los valores de una hoja, usando la primera fila como cabecera.
+
+    Las columnas numéricas presentes se convierten en un solo paso al construir el DataFrame,
+    de modo que el resto del proceso no trabaja sobre cadenas.
+
+    Args:
+        valores (list): Lista de listas con la cabecera en la primera fila.
+
+    Returns:
+        pd.DataFrame: El DataFrame con las columnas numéricas ya convertidas.
+    """
+    encabezado, *filas = valores
+    df = pd.DataFrame.from_records(filas, columns=encabezado)
+    columnas_numericas = [col for col in COLUMNAS_NUMERICAS if col in df.columns]
+    df[columnas_numericas] = df[columnas_numericas].apply(pd.to_numeric, errors='coerce')
+    return df
+
+def convertir_fechas(df):
     """
-    Retrieves values from a specified range in a worksheet.
+    Convierte a datetime las columnas de fecha que todavía no lo son, infiriendo su formato.
+
+    Args:
+        df (pd.DataFrame): Licitaciones; se modifica en el lugar.
+
+    Returns:
+        pd.DataFrame: El mismo DataFrame, con las fechas como datetime64.
+    """
+    for col in COLUMNAS_FECHA:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors='coerce', cache=True)
+    return df
+
+def filtrar_por_fechas(df, fecha_min_publicacion, fecha_min_cierre):
+    """
+    Conserva las licitaciones publicadas y con cierre desde las fechas mínimas.
+
+    Args:
+        df (pd.DataFrame): Licitaciones de una sola fuente; sus fechas se convierten en el lugar.
+        fecha_min_publicacion (pd.Timestamp): Fecha mínima de publicación.
+        fecha_min_cierre (pd.Timestamp): Fecha mínima de cierre.
+
+    Returns:
+        pd.DataFrame: Las licitaciones que cumplen ambos filtros (vacío si faltan las columnas de fecha).
+    """
+    if not set(COLUMNAS_FECHA).issubset(df.columns):
+        return df.iloc[0:0]
+    # Cada fuente usa su propio formato de fecha, así que pandas lo infiere por separado
+    convertir_fechas(df)
+    return df[
+        (df['FechaPublicacion'] >= fecha_min_publicacion) &
+        (df['FechaCierre'] >= fecha_min_cierre)
+    ]
+
+def obtener_valores_hoja(worksheet):
+    """
+    Retrieves all values of a worksheet with numbers unformatted and dates as formatted strings.
+
+    Numeric cells arrive already typed from the Sheets API, so they don't need to be
+    re-parsed from their display text.
 
     Args:
         worksheet (gspread.Worksheet): The worksheet to retrieve data from.
-        rango (str): The range in A1 notation.
 
     Returns:
-        list: A list of lists containing the values.
+        list: A list of lists containing the values, padded to a rectangular shape.
+    """
+    return worksheet.get_values(
+        value_render_option=ValueRenderOption.unformatted,
+        date_time_render_option=DateTimeOption.formatted_string
+    )
+
+@retry(
+    wait=wait_exponential(multiplier=1, min=4, max=10),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception_type(APIError)
+)
+def obtener_configuracion(spreadsheet):
+    """
+    Retrieves every configuration range in a single values.batchGet request.
+
+    Args:
+        spreadsheet (gspread.Spreadsheet): The spreadsheet containing the configuration sheets.
+
+    Returns:
+        dict: A dictionary mapping (sheet name, A1 range) tuples to their list of lists of values.
     """
     try:
-        valores = worksheet.get(rango)
-        logging.info(f"Valores obtenidos del rango {rango}.")
-        return valores
+        rangos = [absolute_range_name(hoja, rango) for hoja, rango in RANGOS_CONFIGURACION]
+        respuesta = spreadsheet.values_batch_get(rangos)
+        configuracion = {
+            clave: rango_valores.get('values', [])
+            for clave, rango_valores in zip(RANGOS_CONFIGURACION, respuesta.get('valueRanges', []))
+        }
+        logging.info(f"Configuración obtenida en una sola llamada ({len(rangos)} rangos).")
+        return configuracion
+    except APIError as e:
+        logging.warning(f"APIError al obtener la configuración: {e}. Reintentando...")
+        raise
     except Exception as e:
-        logging.error(f"Error al obtener valores del rango {rango}: {e}", exc_info=True)
+        logging.error(f"Error al obtener la configuración: {e}", exc_info=True)
         raise
 
-def obtener_palabras_clave(worksheet_inicio):
+def obtener_palabras_clave(configuracion):
     """
     Retrieves and processes keyword phrases from specified ranges in the worksheet.
 
     Args:
-        worksheet_inicio (gspread.Worksheet): The worksheet to retrieve keywords from.
+        configuracion (dict): Configuration values returned by `obtener_configuracion`.
 
     Returns:
-        set: A set of processed keyword phrases.
+        frozenset: A set of processed keyword phrases.
     """
     try:
         palabras_clave = []
         for key, rango in PALABRAS_CLAVE_RANGES.items():
-            valores = obtener_rango_hoja(worksheet_inicio, rango)
+            valores = configuracion[(HOJA_INICIO, rango)]
             palabras_clave.extend([eliminar_tildes_y_normalizar(p) for fila in valores for p in fila if p])
-        palabras_clave_set = set(palabras_clave)
+        palabras_clave_set = frozenset(palabras_clave)
         logging.info(f"Palabras clave obtenidas: {palabras_clave_set}")
         return palabras_clave_set
     except Exception as e:
         logging.error(f"Error al obtener palabras clave: {e}", exc_info=True)
         raise
 
-def obtener_lista_negra(worksheet_lista_negra):
+def obtener_lista_negra(configuracion):
     """
     Retrieves the blacklist phrases from the specified range in the worksheet.
 
     Args:
-        worksheet_lista_negra (gspread.Worksheet): The worksheet to retrieve the blacklist from.
+        configuracion (dict): Configuration values returned by `obtener_configuracion`.
 
     Returns:
-        set: A set of blacklist phrases.
+        frozenset: A set of blacklist phrases.
     """
     try:
-        data_lista_negra = obtener_rango_hoja(worksheet_lista_negra, LISTA_NEGRA_RANGE)
-        lista_negra = set([eliminar_tildes_y_normalizar(row[0]) for row in data_lista_negra if row and row[0].strip()])
+        data_lista_negra = configuracion[(HOJA_LISTA_NEGRA, LISTA_NEGRA_RANGE)]
+        lista_negra = frozenset(eliminar_tildes_y_normalizar(row[0]) for row in data_lista_negra if row and row[0].strip())
         logging.info(f"Lista negra obtenida: {lista_negra}")
         return lista_negra
     except Exception as e:
         logging.error(f"Error al obtener la lista negra: {e}", exc_info=True)
         raise
 
-def obtener_rubros_y_productos(worksheet_inicio):
+def obtener_rubros_y_productos(configuracion):
     """
     Retrieves rubros and their corresponding productos from the worksheet.
 
     Args:
-        worksheet_rubros (gspread.Worksheet): The worksheet to retrieve rubros and productos from.
+        configuracion (dict): Configuration values returned by `obtener_configuracion`.
 
     Returns:
         dict: A dictionary mapping rubros to their list of productos.
     """
     try:
-        # Definir los rangos de rubros
-        rubros_ranges = list(RUBROS_RANGES.values())  # ['C13', 'F13', 'I13']
-        
-        # Utilizar batch_get para recuperar todos los rangos de rubros de una sola vez
-        valores_rubros = worksheet_inicio.batch_get(rubros_ranges)
-        logging.debug(f"Valores de rubros obtenidos: {valores_rubros}")
-        
-        # Extraer los valores de rubros
-        rubros = {
-            key: valores[0][0].strip() if valores and valores[0] and valores[0][0] else None
-            for key, valores in zip(RUBROS_RANGES.keys(), valores_rubros)
-        }
+        # Todas las celdas de rubros y productos vienen en un único bloque; gspread omite las
+        # celdas vacías al final de cada fila y las filas vacías al final del bloque
+        grilla = configuracion[(HOJA_INICIO, RUBROS_PRODUCTOS_RANGE)]
+        fila_origen, columna_origen = a1_to_rowcol(RUBROS_PRODUCTOS_RANGE.split(':')[0])
+
+        def celda(a1):
+            fila, columna = a1_to_rowcol(a1)
+            fila -= fila_origen
+            columna -= columna_origen
+            if fila < len(grilla) and columna < len(grilla[fila]):
+                return grilla[fila][columna]
+            return ''
+
+        # Rubros de las celdas ['C13', 'F13', 'I13']
+        rubros = {key: celda(rango).strip() or None for key, rango in RUBROS_RANGES.items()}
         logging.debug(f"Rubros extraídos: {rubros}")
 
         # Verificar si los rubros están vacíos
@@ -274,23 +558,15 @@ def obtener_rubros_y_productos(worksheet_inicio):
             if rubro is None:
                 logging.warning(f"Rubro '{key}' está vacío en la celda {RUBROS_RANGES[key]}.")
 
-        # Definir los rangos de productos
-        rangos_productos = [r for key in PRODUCTOS_RANGES for r in PRODUCTOS_RANGES[key]]
-        
-        # Utilizar batch_get para recuperar todos los rangos de productos de una sola vez
-        valores_productos = worksheet_inicio.batch_get(rangos_productos)
-        logging.debug(f"Valores de productos obtenidos: {valores_productos}")
-        
-        # Asignar productos a cada rubro
-        productos = {}
-        index = 0
-        for key in PRODUCTOS_RANGES.keys():
-            productos[key] = [
-                eliminar_tildes_y_normalizar(valores_productos[index + i][0][0])
-                for i in range(len(PRODUCTOS_RANGES[key]))
-                if valores_productos[index + i] and valores_productos[index + i][0][0].strip()
+        # Asignar productos a cada rubro, omitiendo las celdas vacías
+        productos = {
+            key: [
+                eliminar_tildes_y_normalizar(valor)
+                for valor in (celda(rango) for rango in rangos)
+                if valor.strip()
             ]
-            index += len(PRODUCTOS_RANGES[key])
+            for key, rangos in PRODUCTOS_RANGES.items()
+        }
         logging.debug(f"Productos asignados por rubro: {productos}")
 
         # Mapear rubros a productos
@@ -307,20 +583,25 @@ def obtener_rubros_y_productos(worksheet_inicio):
         logging.error(f"Error al obtener rubros y productos: {e}", exc_info=True)
         raise
 
-def obtener_puntaje_clientes(worksheet_clientes):
+def obtener_puntaje_clientes(configuracion):
     """
     Retrieves clients and their statuses from the worksheet and assigns scores.
 
     Args:
-        worksheet_clientes (gspread.Worksheet): The worksheet to retrieve client data from.
+        configuracion (dict): Configuration values returned by `obtener_configuracion`.
 
     Returns:
         dict: A dictionary mapping clients to their scores based on status.
     """
     try:
-        # Recuperar todas las filas de clientes y estados de una vez
-        clientes = worksheet_clientes.col_values(4)[3:]  # D4 en adelante
-        estados = worksheet_clientes.col_values(5)[3:]   # E4 en adelante
+        # Separar las columnas D y E (desde la fila 4), descartando las celdas vacías finales
+        filas = configuracion[(HOJA_CLIENTES, CLIENTES_RANGE)]
+        clientes = [fila[0] if len(fila) > 0 else '' for fila in filas]
+        estados = [fila[1] if len(fila) > 1 else '' for fila in filas]
+        while clientes and not clientes[-1]:
+            clientes.pop()
+        while estados and not estados[-1]:
+            estados.pop()
 
         if not clientes or not estados:
             logging.warning("No se encontraron datos en las columnas de clientes o estados.")
@@ -333,6 +614,9 @@ def obtener_puntaje_clientes(worksheet_clientes):
         for cliente, estado in zip(clientes, estados):
             estado_lower = estado.strip().lower()
             cliente_normalizado = eliminar_tildes_y_normalizar(cliente.lower().strip())
+            # Una fila sin cliente no debe puntuar a las licitaciones sin organismo
+            if not cliente_normalizado:
+                continue
             if estado_lower == 'vigente':
                 puntaje_clientes[cliente_normalizado] = 10
             elif estado_lower == 'no vigente':
@@ -345,136 +629,153 @@ def obtener_puntaje_clientes(worksheet_clientes):
         logging.error(f"Error al obtener puntaje de clientes: {e}", exc_info=True)
         raise
 
-def calcular_puntaje_palabra(row, palabras_clave_set, lista_negra):
+def calcular_puntajes_palabra(df, palabras_clave_validas):
     """
-    Calculates the word-based score for a given licitacion.
+    Calculates the word-based score for every licitacion in a DataFrame.
+
+    Each distinct keyword found as a whole word in 'Nombre' or 'Descripcion' adds 10 points.
+    Only single-word keywords can match, since the text is compared word by word.
 
     Args:
-        row (pd.Series): A row from the DataFrame representing a licitacion.
-        palabras_clave_set (set): A set of keyword phrases.
-        lista_negra (set): A set of blacklist phrases.
+        df (pd.DataFrame): Licitaciones with the 'Nombre' and 'Descripcion' columns, already
+            normalized with `normalizar_serie`.
+        palabras_clave_validas (frozenset): Keyword phrases with the blacklist already removed.
 
     Returns:
-        int: The calculated word-based score.
+        np.ndarray: The word-based score of each row, in the same order as `df`.
     """
     try:
-        nombre = eliminar_tildes_y_normalizar(row['Nombre']) if pd.notnull(row['Nombre']) else ''
-        descripcion = eliminar_tildes_y_normalizar(row['Descripcion']) if pd.notnull(row['Descripcion']) else ''
-        puntaje_palabra = 0
-
-        # Combinar nombre y descripción
-        texto = f"{nombre} {descripcion}"
+        puntajes = np.zeros(len(df), dtype=np.int64)
+        palabras = sorted(palabra for palabra in palabras_clave_validas if re.fullmatch(r'\w+', palabra))
+        if not palabras or df.empty:
+            return puntajes
 
-        # Tokenizar el texto
-        palabras_texto = set(re.findall(r'\b\w+\b', texto))
+        # Combinar nombre y descripción (ya normalizados por quien llama)
+        texto = df['Nombre'].fillna('').astype(str) + ' ' + df['Descripcion'].fillna('').astype(str)
 
-        # Excluir palabras de la lista negra
-        palabras_texto = palabras_texto - lista_negra
+        # Una sola pasada con todas las palabras clave en alternancia; +10 por cada palabra distinta encontrada
+        patron = re.compile(r'\b(?:' + '|'.join(map(re.escape, palabras)) + r')\b')
+        encontradas = texto.str.findall(patron).map(frozenset)
+        puntajes += encontradas.map(len).to_numpy(dtype=np.int64) * 10
 
-        # Calcular intersección con palabras clave
-        palabras_encontradas = palabras_clave_set.intersection(palabras_texto)
-        puntaje_palabra += len(palabras_encontradas) * 10  # +10 por cada palabra clave encontrada
+        conteo_palabras = pd.Series([palabra for conjunto in encontradas for palabra in conjunto]).value_counts()
+        for palabra, cantidad in conteo_palabras.sort_index().items():
+            logging.info(f"Palabra clave '{palabra}' encontrada en {cantidad} licitaciones.")
 
-        for palabra in palabras_encontradas:
-            logging.info(f"Palabra clave '{palabra}' encontrada en la licitación.")
-
-        logging.debug(f"Puntaje calculado para palabras clave: {puntaje_palabra}")
-        return puntaje_palabra
+        logging.debug(f"Puntaje por palabras clave calculado para {len(df)} licitaciones.")
+        return puntajes
     except Exception as e:
         logging.error(f"Error al calcular puntaje por palabra clave: {e}", exc_info=True)
-        return 0
+        return np.zeros(len(df), dtype=np.int64)
 
-def calcular_puntaje_rubro(row, rubros_y_productos):
+def calcular_puntajes_rubro(df, rubros_y_productos):
     """
-    Calcula el puntaje basado en los rubros y el código de producto ONU definido.
+    Calcula el puntaje por rubros y código de producto ONU de todas las licitaciones de un DataFrame.
+
+    Cada rubro contenido en 'Rubro3' suma 5 puntos y un 'CodigoProductoONU' asociado a
+    cualquier rubro suma 10 puntos.
 
     Args:
-        row (pd.Series): Una fila del DataFrame representando una licitación.
+        df (pd.DataFrame): Licitaciones con la columna 'Rubro3' y, opcionalmente, 'CodigoProductoONU'.
         rubros_y_productos (dict): Diccionario que mapea rubros a listas de códigos de productos ONU.
 
     Returns:
-        int: Puntaje calculado basado en rubros y códigos de productos ONU.
+        np.ndarray: Puntaje por rubro de cada fila, en el mismo orden de `df`.
     """
     try:
-        rubro_column = row.get('Rubro3', '') if pd.notnull(row.get('Rubro3', '')) else ''
-        codigo_producto_column = str(row.get('CodigoProductoONU', '')).strip() if pd.notnull(row.get('CodigoProductoONU', '')) else ''
-        puntaje_rubro = 0
-
-        rubros_presentes = set()
-        productos_presentes = set()
-
-        for rubro, productos in rubros_y_productos.items():
-            # Comparación parcial para el rubro
-            if rubro and rubro in rubro_column:
-                rubros_presentes.add(rubro)
-
-            # Comparación exacta para los productos asociados al rubro
-            if codigo_producto_column in productos:
-                productos_presentes.add(codigo_producto_column)
-
-        puntaje_rubro += len(rubros_presentes) * 5  # Puntaje por cada rubro coincidente
-        puntaje_rubro += len(productos_presentes) * 10  # Puntaje por cada código de producto coincidente
-
-        logging.debug(f"Fila evaluada: Rubros={rubros_presentes}, Productos ONU={productos_presentes}, Puntaje={puntaje_rubro}")
-        return puntaje_rubro
+        puntajes = np.zeros(len(df), dtype=np.int64)
+        # Comparar solo los textos de rubro distintos; el código -1 (nulo) apunta al False final
+        codigos_rubro, rubros_unicos = pd.factorize(df['Rubro3'])
+        rubros_texto = pd.Series(np.asarray(rubros_unicos, dtype=object)).astype(str)
+
+        # Comparación parcial para cada rubro
+        for rubro in rubros_y_productos:
+            if rubro:
+                contiene = np.append(rubros_texto.str.contains(rubro, regex=False).to_numpy(dtype=bool), False)
+                puntajes += contiene[codigos_rubro] * 5
+
+        # Comparación exacta para los productos asociados a cualquier rubro
+        if 'CodigoProductoONU' in df.columns:
+            codigos_productos = [codigo for productos in rubros_y_productos.values() for codigo in productos]
+            codigos_producto = df['CodigoProductoONU'].fillna('').astype(str).str.strip()
+            puntajes += codigos_producto.isin(codigos_productos).to_numpy() * 10
+
+        logging.debug(f"Puntaje por rubro calculado para {len(df)} licitaciones.")
+        return puntajes
     except Exception as e:
         logging.error(f"Error al calcular puntaje por rubro: {e}", exc_info=True)
-        return 0
+        return np.zeros(len(df), dtype=np.int64)
 
 
-def calcular_puntaje_monto(tipo_licitacion, tiempo_duracion_contrato):
+def calcular_puntajes_monto(df):
     """
-    Calculates the monto-based score for a given licitacion.
+    Calcula el puntaje por monto de todas las licitaciones de un DataFrame.
+
+    El puntaje es el monto base del 'Tipo' dividido por 'TiempoDuracionContrato'; es 0 si
+    el tipo no tiene monto o la duración no es un número positivo.
 
     Args:
-        tipo_licitacion (str): The type of the licitacion.
-        tiempo_duracion_contrato (str): The duration of the contract.
+        df (pd.DataFrame): Licitaciones con las columnas 'Tipo' y 'TiempoDuracionContrato'.
 
     Returns:
-        float: The calculated monto-based score.
+        np.ndarray: Puntaje por monto de cada fila, en el mismo orden de `df`.
     """
-    montos_por_tipo = {
-        'L1': 0, 'LE': 100, 'LP': 1000, 'LQ': 2000, 'LR': 5000, 'LS': 0,
-        'E2': 0, 'CO': 100, 'B2': 1000, 'H2': 2000, 'I2': 5000
-    }
-
     try:
-        tipo = tipo_licitacion.strip().upper()
-        monto_base = montos_por_tipo.get(tipo, 0)
-
-        tiempo_duracion = float(tiempo_duracion_contrato)
-        if tiempo_duracion > 0:
-            puntaje_monto = monto_base / tiempo_duracion
-            return puntaje_monto
-        else:
-            return 0
-    except ValueError:
-        return 0
+        monto_base = (
+            df['Tipo'].astype(str).str.strip().str.upper()
+            .map(MONTOS_POR_TIPO).fillna(0).to_numpy(dtype=np.float64)
+        )
+        duracion = pd.to_numeric(df['TiempoDuracionContrato'], errors='coerce').to_numpy(dtype=np.float64)
+        positiva = duracion > 0
+        return np.divide(monto_base, duracion, out=np.zeros(len(df), dtype=np.float64), where=positiva)
     except Exception as e:
         logging.error(f"Error al calcular puntaje por monto: {e}", exc_info=True)
-        return 0
+        return np.zeros(len(df), dtype=np.float64)
 
-def calcular_puntaje_clientes(nombre_organismo, puntaje_clientes):
+def calcular_puntajes_clientes(df, puntaje_clientes):
     """
-    Retrieves the client score based on the organismo's name.
+    Retrieves the client score of every licitacion based on the organismo's name.
 
     Args:
-        nombre_organismo (str): The name of the organismo.
+        df (pd.DataFrame): Licitaciones with the 'NombreOrganismo' column, already normalized
+            with `normalizar_serie` like the keys of `puntaje_clientes`.
         puntaje_clientes (dict): A dictionary mapping clientes to their scores.
 
     Returns:
-        int: The score assigned to the client.
+        np.ndarray: The score assigned to the client of each row, in the same order as `df`.
     """
     try:
-        if not nombre_organismo:
-            return 0
-        cliente_normalizado = eliminar_tildes_y_normalizar(nombre_organismo.lower().strip())
-        puntaje = puntaje_clientes.get(cliente_normalizado, 0)
-        logging.info(f"Cliente '{cliente_normalizado}' tiene puntaje {puntaje}")
-        return puntaje
+        puntajes = df['NombreOrganismo'].astype(object).map(puntaje_clientes).fillna(0).to_numpy(dtype=np.int64)
+        logging.info(f"Licitaciones de clientes con puntaje: {int(np.count_nonzero(puntajes))}")
+        return puntajes
     except Exception as e:
         logging.error(f"Error al calcular puntaje por clientes: {e}", exc_info=True)
-        return 0
+        return np.zeros(len(df), dtype=np.int64)
+
+def calcular_puntajes_relativos(df_top, ponderaciones):
+    """
+    Calcula los puntajes relativos de cada criterio y el 'Puntaje Total SUMAPRODUCTO'.
+
+    Los cuatro puntajes se procesan como una sola matriz: cada columna se escala para que
+    sume 100 (o queda en 0 si su total es 0) y el puntaje final es su producto con las ponderaciones.
+
+    Args:
+        df_top (pd.DataFrame): Licitaciones seleccionadas, con las columnas de COLUMNAS_PUNTAJE.
+        ponderaciones (dict): Diccionario con la ponderación de cada criterio.
+
+    Returns:
+        pd.DataFrame: Copia de `df_top` con los puntajes relativos y el 'Puntaje Total SUMAPRODUCTO'.
+    """
+    puntajes = df_top[COLUMNAS_PUNTAJE].to_numpy(dtype=np.float64)
+    totales = puntajes.sum(axis=0)
+    escalas = np.divide(100.0, totales, out=np.zeros_like(totales), where=totales > 0)
+    relativos = puntajes * escalas
+    pesos = np.array([ponderaciones.get(col, 0) for col in COLUMNAS_PUNTAJE], dtype=np.float64)
+
+    return df_top.assign(
+        **dict(zip(COLUMNAS_PUNTAJE_RELATIVO, relativos.T)),
+        **{'Puntaje Total SUMAPRODUCTO': relativos @ pesos}
+    )
 
 # -------------------------- Google Sheets Update with Retry --------------------------
 
@@ -490,21 +791,15 @@ def actualizar_hoja(worksheet, rango, datos):
     Args:
         worksheet (gspread.Worksheet): La hoja de cálculo a actualizar.
         rango (str): El rango en notación A1.
-        datos (list): Los datos a subir.
+        datos (list): Los datos a subir, ya serializables (ver `dataframe_a_valores`).
 
     Raises:
         APIError: Si la actualización falla debido a un error de la API.
         Exception: Para cualquier otro error.
     """
     try:
-        # Aplicar serialización a todos los elementos
-        datos_serializados = [
-            [serialize_value(x) for x in row]
-            for row in datos
-        ]
-
         worksheet.update(
-            values=datos_serializados,
+            values=datos,
             range_name=rango,
             value_input_option='USER_ENTERED'
         )
@@ -516,41 +811,113 @@ def actualizar_hoja(worksheet, rango, datos):
         logging.error(f"Error al actualizar la Hoja en el rango {rango}: {e}", exc_info=True)
         raise
 
+@retry(
+    wait=wait_exponential(multiplier=1, min=4, max=10),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception_type(APIError)
+)
+def reemplazar_hojas_por_lotes(spreadsheet, hojas, datos_por_rango):
+    """
+    Limpia varias hojas y escribe varios rangos con una llamada values.batchClear y una values.batchUpdate.
+
+    Args:
+        spreadsheet (gspread.Spreadsheet): El libro que contiene las hojas.
+        hojas (list): Títulos de las hojas que se limpian por completo antes de escribir.
+        datos_por_rango (dict): Diccionario que mapea tuplas (título de hoja, rango A1) a los datos
+            a subir, ya serializables (ver `dataframe_a_valores`).
+
+    Raises:
+        APIError: Si la actualización falla debido a un error de la API.
+        Exception: Para cualquier otro error.
+    """
+    rangos = [absolute_range_name(hoja, rango) for hoja, rango in datos_por_rango]
+    try:
+        spreadsheet.values_batch_clear(body={'ranges': [absolute_range_name(hoja) for hoja in hojas]})
+        spreadsheet.values_batch_update(body={
+            'valueInputOption': 'USER_ENTERED',
+            'data': [
+                {'range': rango, 'values': datos}
+                for rango, datos in zip(rangos, datos_por_rango.values())
+            ]
+        })
+        logging.info(f"Hojas {list(hojas)} limpiadas y actualizadas en los rangos {rangos}.")
+    except APIError as e:
+        logging.warning(f"APIError al reemplazar los rangos {rangos}: {e}. Reintentando...")
+        raise
+    except Exception as e:
+        logging.error(f"Error al reemplazar los rangos {rangos}: {e}", exc_info=True)
+        raise
+
 # -------------------------- Data Retrieval Functions --------------------------
 
-def procesar_licitaciones(url):
+def leer_csv_zip(zip_file, file_name, fecha_min_publicacion, fecha_min_cierre):
+    """
+    Reads one CSV of licitaciones from an open ZIP file, keeping only the rows within the minimum dates.
+
+    Args:
+        zip_file (ZipFile): The open ZIP file.
+        file_name (str): The name of the CSV inside the ZIP file.
+        fecha_min_publicacion (pd.Timestamp): Minimum publication date.
+        fecha_min_cierre (pd.Timestamp): Minimum closing date.
+
+    Returns:
+        list: The filtered DataFrame chunks read from the CSV (empty if it could not be processed).
+    """
+    logging.info(f"Procesando {file_name}...")
+    try:
+        # Leer por bloques y solo las columnas que se usan después
+        lector = pd.read_csv(
+            zip_file.open(file_name),
+            encoding='ISO-8859-1',
+            sep=';',
+            on_bad_lines='skip',
+            low_memory=False,
+            usecols=lambda columna: columna in COLUMNAS_IMPORTANTES,
+            dtype=CSV_DTYPES,
+            chunksize=CSV_CHUNKSIZE
+        )
+        # Filtrar cada bloque al leerlo, así solo las filas vigentes permanecen en memoria
+        with lector:
+            bloques = [filtrar_por_fechas(bloque, fecha_min_publicacion, fecha_min_cierre) for bloque in lector]
+        logging.info(f"Archivo {file_name} procesado exitosamente.")
+        return bloques
+    except Exception as e:
+        logging.error(f"Error procesando el archivo {file_name}: {e}", exc_info=True)
+        return []
+
+def procesar_licitaciones(url, fecha_min_publicacion, fecha_min_cierre):
     """
     Downloads and processes a ZIP file containing CSVs of licitaciones.
 
     Args:
         url (str): The URL to download the ZIP file from.
+        fecha_min_publicacion (pd.Timestamp): Minimum publication date of the rows to keep.
+        fecha_min_cierre (pd.Timestamp): Minimum closing date of the rows to keep.
 
     Returns:
-        pd.DataFrame: A concatenated DataFrame of all processed CSVs.
+        pd.DataFrame: A concatenated DataFrame of the rows of all CSVs within the minimum dates.
     """
     try:
         logging.info(f"Descargando licitaciones desde: {url}")
-        response = requests.get(url)
-        response.raise_for_status()
-        zip_file = ZipFile(BytesIO(response.content))
-        logging.info(f"Archivo ZIP descargado y abierto exitosamente desde: {url}")
-
-        df_list = []
-        for file_name in zip_file.namelist():
-            if file_name.endswith('.csv'):
-                logging.info(f"Procesando {file_name}...")
-                try:
-                    df = pd.read_csv(
-                        zip_file.open(file_name),
-                        encoding='ISO-8859-1',
-                        sep=';',
-                        on_bad_lines='skip',
-                        low_memory=False
-                    )
-                    df_list.append(df)
-                    logging.info(f"Archivo {file_name} procesado exitosamente.")
-                except Exception as e:
-                    logging.error(f"Error procesando el archivo {file_name}: {e}", exc_info=True)
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as archivo_zip:
+            with DESCARGAS_SESSION.get(url, stream=True) as response:
+                response.raise_for_status()
+                # Escribir el cuerpo por bloques en lugar de materializar response.content
+                for bloque in response.iter_content(chunk_size=1 << 20):
+                    archivo_zip.write(bloque)
+            archivo_zip.seek(0)
+
+            with ZipFile(archivo_zip) as zip_file:
+                logging.info(f"Archivo ZIP descargado y abierto exitosamente desde: {url}")
+
+                # Parsear los CSV en paralelo; ZipFile serializa internamente las lecturas del archivo
+                csv_names = [file_name for file_name in zip_file.namelist() if file_name.endswith('.csv')]
+                with ThreadPoolExecutor(max_workers=CSV_MAX_WORKERS) as executor:
+                    bloques_por_archivo = list(executor.map(
+                        lambda file_name: leer_csv_zip(zip_file, file_name, fecha_min_publicacion, fecha_min_cierre),
+                        csv_names
+                    ))
+                df_list = [bloque for bloques in bloques_por_archivo for bloque in bloques]
 
         if df_list:
             df_concatenado = pd.concat(df_list, ignore_index=True)
@@ -566,12 +933,14 @@ def procesar_licitaciones(url):
         logging.error(f"Error descargando o procesando el archivo desde {url}: {e}", exc_info=True)
         return pd.DataFrame()
 
-def integrar_licitaciones_sicep(worksheet_sicep):
+def integrar_licitaciones_sicep(worksheet_sicep, subir=True):
     """
     Integrates licitaciones from SICEP into the designated worksheet.
 
     Args:
         worksheet_sicep (gspread.Worksheet): The worksheet to upload SICEP licitaciones.
+        subir (bool): Whether to upload them here; when False the caller uploads them
+            (e.g. batched with other sheets through `reemplazar_hojas_por_lotes`).
 
     Returns:
         pd.DataFrame: The DataFrame of SICEP licitaciones.
@@ -595,17 +964,14 @@ def integrar_licitaciones_sicep(worksheet_sicep):
             if columna not in df_sicep.columns:
                 df_sicep[columna] = None
 
-        # Convert to list of lists for Google Sheets
-        data_to_upload = [df_sicep.columns.values.tolist()] + df_sicep.values.tolist()
-        data_to_upload = [
-            [serialize_value(x) for x in row]
-            for row in data_to_upload
-        ]
+        if subir:
+            # Convert to list of lists for Google Sheets
+            data_to_upload = dataframe_a_valores(df_sicep)
 
-        # Clear and update the worksheet
-        worksheet_sicep.clear()
-        actualizar_hoja(worksheet_sicep, 'A1', data_to_upload)
-        logging.info("Licitaciones de SICEP subidas exitosamente a la Hoja 11.")
+            # Clear and update the worksheet
+            worksheet_sicep.clear()
+            actualizar_hoja(worksheet_sicep, 'A1', data_to_upload)
+            logging.info("Licitaciones de SICEP subidas exitosamente a la Hoja 11.")
         return df_sicep
     except APIError as e:
         logging.error(f"APIError al actualizar la Hoja 11: {e}", exc_info=True)
@@ -642,9 +1008,11 @@ def procesar_licitaciones_y_generar_ranking(
         worksheet_sicep (gspread.Worksheet): Worksheet containing SICEP licitaciones.
     """
     try:
+        # Read every configuration range (Hoja 1, Clientes, lista negra and Selección) in one request
+        configuracion = obtener_configuracion(worksheet_inicio.spreadsheet)
 
         # Extract minimum dates from Hoja 1
-        valores_fechas = obtener_rango_hoja(worksheet_inicio, FECHAS_RANGE)
+        valores_fechas = configuracion[(HOJA_INICIO, FECHAS_RANGE)]
         if len(valores_fechas) < 2 or not all(valores_fechas):
             logging.error("No se pudieron obtener las fechas mínimas desde la Hoja 1.")
             raise ValueError("Fechas mínimas no encontradas.")
@@ -691,146 +1059,149 @@ def procesar_licitaciones_y_generar_ranking(
         logging.info(f"URL del mes actual: {url_mes_actual}")
         logging.info(f"URL del mes anterior: {url_mes_anterior}")
 
-        # Download and process licitaciones
-        df_mes_actual = procesar_licitaciones(url_mes_actual)
-        df_mes_anterior = procesar_licitaciones(url_mes_anterior)
+        # The monthly archives are partitioned by publication month, so last month's file
+        # can only contribute rows when the minimum publication date falls before this month
+        necesita_mes_anterior = fecha_min_publicacion < pd.Timestamp(año_actual, mes_actual, 1)
+        if not necesita_mes_anterior:
+            logging.info("La fecha mínima de publicación está en el mes actual; se omite la descarga del mes anterior.")
+
+        # Download and process the months concurrently (the work is network-bound)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futuro_mes_actual = executor.submit(
+                procesar_licitaciones, url_mes_actual, fecha_min_publicacion, fecha_min_cierre
+            )
+            futuro_mes_anterior = executor.submit(
+                procesar_licitaciones, url_mes_anterior, fecha_min_publicacion, fecha_min_cierre
+            ) if necesita_mes_anterior else None
+            df_mes_actual = futuro_mes_actual.result()
+            df_mes_anterior = futuro_mes_anterior.result() if futuro_mes_anterior else pd.DataFrame()
 
         # Integrate SICEP licitaciones
-        df_sicep = integrar_licitaciones_sicep(worksheet_sicep)
+        df_sicep = integrar_licitaciones_sicep(worksheet_sicep, subir=False)
+
+        # Hoja 11 is uploaded together with Hoja 7 below; serialize it before its dates are converted
+        hojas_a_reemplazar = [worksheet_sicep.title]
+        datos_por_rango = {(worksheet_sicep.title, 'A1'): dataframe_a_valores(df_sicep)}
 
-        # Concatenate all licitaciones
-        df_licitaciones = pd.concat([df_mes_actual, df_mes_anterior, df_sicep], ignore_index=True)
-        logging.info(f"Total de licitaciones después de concatenar: {len(df_licitaciones)}")
+        # The monthly downloads are already filtered chunk by chunk; SICEP is filtered before concatenating
+        logging.info(f"Licitaciones de SICEP descargadas: {len(df_sicep)}")
+        df_nuevas_filtradas = pd.concat(
+            [df_mes_actual, df_mes_anterior, filtrar_por_fechas(df_sicep, fecha_min_publicacion, fecha_min_cierre)],
+            ignore_index=True
+        )
+        logging.info(f"Total de licitaciones después de aplicar filtros de fecha: {len(df_nuevas_filtradas)}")
 
+        # Store the repetitive text columns as 'category' to cut memory in the following steps
+        for col in COLUMNAS_CATEGORICAS_DESCARGA:
+            if col in df_nuevas_filtradas.columns:
+                df_nuevas_filtradas[col] = df_nuevas_filtradas[col].astype('category')
 
         # Remove diacritics and convert to lowercase
-        for col in ['Nombre', 'Descripcion', 'Rubro3', 'Nombre producto genrico', 'NombreOrganismo']:
-            if col in df_licitaciones.columns:
-                df_licitaciones[col] = df_licitaciones[col].apply(lambda x: eliminar_tildes_y_normalizar(x) if isinstance(x, str) else x)
+        for col in COLUMNAS_TEXTO:
+            if col in df_nuevas_filtradas.columns:
+                df_nuevas_filtradas[col] = normalizar_serie(df_nuevas_filtradas[col])
         
-        if 'CodigoProductoONU' in df_licitaciones.columns:
-            df_licitaciones['CodigoProductoONU'] = df_licitaciones['CodigoProductoONU'].apply(lambda x: eliminar_tildes_y_normalizar(str(x).split('.')[0]) if pd.notnull(x) else x)
-
-        # Convert date columns to datetime
-        for col in ['FechaPublicacion', 'FechaCierre']:
-            if col in df_licitaciones.columns:
-                df_licitaciones[col] = pd.to_datetime(df_licitaciones[col], errors='coerce')
-
-        # Filter by minimum dates
-        df_nuevas_filtradas = df_licitaciones[
-            (df_licitaciones['FechaPublicacion'] >= fecha_min_publicacion) &
-            (df_licitaciones['FechaCierre'] >= fecha_min_cierre)
-        ]
-        logging.info(f"Total de licitaciones después de aplicar filtros de fecha: {len(df_nuevas_filtradas)}")
+        if 'CodigoProductoONU' in df_nuevas_filtradas.columns:
+            df_nuevas_filtradas['CodigoProductoONU'] = normalizar_codigos_producto(df_nuevas_filtradas['CodigoProductoONU'])
 
+        # 'CodigoExterno' values selected in Hoja 3, which must not remain in Hoja 7
+        codigos_seleccionados = [fila[0] for fila in configuracion[(HOJA_SELECCION, SELECCION_RANGE)] if fila]
 
+        # Contents of Hoja 7 when they are known in memory (None means the sheet must be read)
+        df_hoja7 = None
         if df_nuevas_filtradas.empty:
             logging.warning("No hay nuevas licitaciones que cumplan con los criterios de fecha.")
         else:
-            # Clear Hoja 7 before uploading new data
-            worksheet_licitaciones_activas.clear()
-            logging.info("Hoja 7 (Licitaciones MP) limpiada exitosamente.")
+            # Select and order columns according to COLUMNAS_IMPORTANTES (missing ones become empty)
+            df_nuevas_filtradas = df_nuevas_filtradas.reindex(columns=COLUMNAS_IMPORTANTES)
 
-            # Ensure all necessary columns are present
-            for columna in COLUMNAS_IMPORTANTES:
-                if columna not in df_nuevas_filtradas.columns:
-                    df_nuevas_filtradas[columna] = None  # Assign None if column is missing
+            # Drop the selected licitaciones now, so Hoja 7 is written only once
+            df_nuevas_filtradas = excluir_licitaciones_seleccionadas(df_nuevas_filtradas, codigos_seleccionados)
 
-            # Order columns according to COLUMNAS_IMPORTANTES
-            df_nuevas_filtradas = df_nuevas_filtradas[COLUMNAS_IMPORTANTES]
+            # Hoja 7 is cleared and replaced in the same batch as Hoja 11
+            hojas_a_reemplazar.append(worksheet_licitaciones_activas.title)
+            datos_por_rango[(worksheet_licitaciones_activas.title, 'A1')] = dataframe_a_valores(df_nuevas_filtradas)
 
-            # Convert to list of lists for Google Sheets
-            data_to_upload = [df_nuevas_filtradas.columns.values.tolist()] + df_nuevas_filtradas.values.tolist()
-            data_to_upload = [
-                [serialize_value(x) for x in row]
-                for row in data_to_upload
-            ]
+            # Hoja 7 will hold exactly these rows; keep them instead of downloading the sheet again
+            df_hoja7 = df_nuevas_filtradas.reset_index(drop=True)
+            df_hoja7[COLUMNAS_NUMERICAS] = df_hoja7[COLUMNAS_NUMERICAS].apply(pd.to_numeric, errors='coerce')
 
-            # Upload the data to Hoja 7
-            actualizar_hoja(worksheet_licitaciones_activas, 'A1', data_to_upload)
-            logging.info("Nuevas licitaciones cargadas a la Hoja 7 (Licitaciones MP).")
+        # Clear and upload Hoja 11 (SICEP) and, if there are new licitaciones, Hoja 7 in two requests
+        reemplazar_hojas_por_lotes(worksheet_sicep.spreadsheet, hojas_a_reemplazar, datos_por_rango)
 
         # -------------- Eliminar Licitaciones Seleccionadas --------------
-        # Call the function to remove selected licitaciones after uploading new licitaciones
-        eliminar_licitaciones_seleccionadas(worksheet_seleccion, worksheet_licitaciones_activas)
-
-        # Re-obtain active licitaciones after elimination
-        licitaciones_actualizadas = worksheet_licitaciones_activas.get_all_values()
-        if not licitaciones_actualizadas or len(licitaciones_actualizadas) < 2:
+        # When Hoja 7 was not rewritten, remove the selected licitaciones from the sheet itself;
+        # either way the remaining Hoja 7 licitaciones are at hand, so the sheet is not read again
+        if df_hoja7 is None:
+            df_licitaciones = eliminar_licitaciones_seleccionadas(
+                worksheet_seleccion, worksheet_licitaciones_activas, codigos_seleccionados
+            )
+        else:
+            df_licitaciones = df_hoja7
+        if df_licitaciones.empty:
             logging.warning("No hay licitaciones activas después de la eliminación.")
             return
 
-        df_licitaciones = pd.DataFrame(licitaciones_actualizadas[1:], columns=licitaciones_actualizadas[0])
         logging.info(f"Total de licitaciones activas después de eliminar seleccionadas: {len(df_licitaciones)}")
 
 
 
-        # Normalize and clean columns before processing
-        for col in ['Nombre', 'Descripcion', 'Rubro3', 'Nombre producto genrico', 'NombreOrganismo']:
-            if col in df_licitaciones.columns:
-                df_licitaciones[col] = df_licitaciones[col].apply(lambda x: eliminar_tildes_y_normalizar(x) if isinstance(x, str) else x)
-        
-        if 'CodigoProductoONU' in df_licitaciones.columns:
-            df_licitaciones['CodigoProductoONU'] = df_licitaciones['CodigoProductoONU'].apply(lambda x: eliminar_tildes_y_normalizar(str(x).split('.')[0]) if pd.notnull(x) else x)
+        # Normalize and clean columns before processing; the in-memory Hoja 7 rows were
+        # already normalized before being uploaded, so only rows read from the sheet need it
+        if df_hoja7 is None:
+            for col in COLUMNAS_TEXTO:
+                if col in df_licitaciones.columns:
+                    df_licitaciones[col] = normalizar_serie(df_licitaciones[col])
 
-        # Convert date columns to datetime
-        for col in ['FechaPublicacion', 'FechaCierre']:
-            if col in df_licitaciones.columns:
-                df_licitaciones[col] = pd.to_datetime(df_licitaciones[col], errors='coerce')
+            if 'CodigoProductoONU' in df_licitaciones.columns:
+                df_licitaciones['CodigoProductoONU'] = normalizar_codigos_producto(df_licitaciones['CodigoProductoONU'])
 
-        # -------------- Exclude Health-Related Organizations (Vectorized) --------------
+        # Convert date columns to datetime (rows kept in memory already are). Rows read back from
+        # Hoja 7 arrive as formatted strings: ISO text if Sheets kept them as text, or the display
+        # format if USER_ENTERED turned them into dates, so the format is inferred as in the download
+        convertir_fechas(df_licitaciones)
 
-        # Create a regex pattern for exclusion terms
-        patron_exclusion = '|'.join([re.escape(termino.lower()) for termino in SALUD_EXCLUIR])
+        # Keep the repetitive text columns as 'category' from here to the final selection
+        for col in COLUMNAS_CATEGORICAS_DESCARGA:
+            if col in df_licitaciones.columns:
+                df_licitaciones[col] = df_licitaciones[col].astype('category')
 
-        # Normalize 'NombreOrganismo' for filtering
-        df_licitaciones['NombreOrganismo_normalizado'] = df_licitaciones['NombreOrganismo'].astype(str).apply(lambda x: eliminar_tildes_y_normalizar(x))
+        # -------------- Exclude Health-Related Organizations (Vectorized) --------------
 
-        # Apply the filter using str.contains with case insensitivity
-        df_filtrado_salud = df_licitaciones[
-            df_licitaciones['NombreOrganismo_normalizado'].str.contains(patron_exclusion, case=False, na=False)
-        ]
-        num_filtradas_salud = len(df_filtrado_salud)
-        df_licitaciones = df_licitaciones[
-            ~df_licitaciones['NombreOrganismo_normalizado'].str.contains(patron_exclusion, case=False, na=False)
-        ]
+        # Apply the filter once per distinct organism ('NombreOrganismo' is already normalized) and reuse the mask
+        mascara_salud = mascara_organismos_salud(df_licitaciones['NombreOrganismo'], SALUD_EXCLUIR_REGEX)
+        num_filtradas_salud = int(mascara_salud.sum())
+        df_licitaciones = df_licitaciones[~mascara_salud]
         logging.info(f"Total de licitaciones después de excluir organizaciones de salud: {len(df_licitaciones)}")
         logging.info(f"Total de licitaciones filtradas por salud: {num_filtradas_salud}")
 
 
 
         # -------------- Calcular Puntajes --------------
-        palabras_clave = obtener_palabras_clave(worksheet_inicio)
-        lista_negra = obtener_lista_negra(worksheet_lista_negra)
-        rubros_y_productos = obtener_rubros_y_productos(worksheet_inicio)
-        puntaje_clientes = obtener_puntaje_clientes(worksheet_clientes)
-        ponderaciones = obtener_ponderaciones(worksheet_inicio)
-
-        df_licitaciones['Puntaje Palabra'] = df_licitaciones.apply(
-            lambda row: calcular_puntaje_palabra(row, palabras_clave, lista_negra), axis=1
-        )
-        df_licitaciones['Puntaje Rubro'] = df_licitaciones.apply(
-            lambda row: calcular_puntaje_rubro(row, rubros_y_productos), axis=1
-        )
-        df_licitaciones['Puntaje Monto'] = df_licitaciones.apply(
-            lambda row: calcular_puntaje_monto(row['Tipo'], row['TiempoDuracionContrato']), axis=1
-        )
-        df_licitaciones['Puntaje Clientes'] = df_licitaciones['NombreOrganismo'].apply(
-            lambda cliente: calcular_puntaje_clientes(cliente, puntaje_clientes)
-        )
+        palabras_clave = obtener_palabras_clave(configuracion)
+        lista_negra = obtener_lista_negra(configuracion)
+        rubros_y_productos = obtener_rubros_y_productos(configuracion)
+        puntaje_clientes = obtener_puntaje_clientes(configuracion)
+        ponderaciones = obtener_ponderaciones(configuracion)
+
+        # Excluir la lista negra de las palabras clave una sola vez
+        palabras_clave_validas = palabras_clave - lista_negra
+
+        df_licitaciones['Puntaje Palabra'] = calcular_puntajes_palabra(df_licitaciones, palabras_clave_validas)
+        df_licitaciones['Puntaje Rubro'] = calcular_puntajes_rubro(df_licitaciones, rubros_y_productos)
+        df_licitaciones['Puntaje Monto'] = calcular_puntajes_monto(df_licitaciones)
+        df_licitaciones['Puntaje Clientes'] = calcular_puntajes_clientes(df_licitaciones, puntaje_clientes)
 
         # Calcular puntaje total
-        df_licitaciones['Puntaje Total'] = (
-            df_licitaciones['Puntaje Rubro'] +
-            df_licitaciones['Puntaje Palabra'] +
-            df_licitaciones['Puntaje Monto'] +
-            df_licitaciones['Puntaje Clientes']
-        )
-        logging.info("Puntaje total calculado.")
+        # Sumar los cuatro criterios como un bloque float64
+        df_licitaciones['Puntaje Total'] = df_licitaciones[COLUMNAS_PUNTAJE].to_numpy(dtype=np.float64).sum(axis=1)
+        logging.debug("Puntaje total calculado.")
 
 
         # Eliminar duplicados basados en 'CodigoExterno', manteniendo la fila con mayor 'Puntaje Total'
-        df_licitaciones_unique = df_licitaciones.sort_values(by='Puntaje Total', ascending=False).drop_duplicates(subset='CodigoExterno', keep='first')
+        # (idxmax por grupo en lugar de ordenar todas las filas; solo se ordenan las filas únicas)
+        indices_maximos = df_licitaciones.groupby('CodigoExterno', sort=False, observed=True, dropna=False)['Puntaje Total'].idxmax()
+        df_licitaciones_unique = df_licitaciones.loc[indices_maximos].sort_values(by='Puntaje Total', ascending=False)
         logging.info(f"Licitaciones después de eliminar duplicados: {len(df_licitaciones_unique)}")        
 
 
@@ -841,78 +1212,28 @@ def procesar_licitaciones_y_generar_ranking(
              'Puntaje Monto', 'Puntaje Clientes', 'Puntaje Total']
         ].copy()  # Asegura una copia independiente
 
-        # Convertir a lista de listas y serializar
-        data_no_relativos = [df_no_relativos.columns.values.tolist()] + df_no_relativos.values.tolist()
-        data_no_relativos = [
-            [serialize_value(x) for x in row]
-            for row in data_no_relativos
-        ]
-
-        # Limpiar la Hoja 8 antes de subir nuevos datos
-        worksheet_ranking_no_relativo.clear()
-        logging.info("Hoja 8 (Ranking no relativo) limpiada exitosamente.")        
-
-        # Subir los datos a Google Sheets
-        actualizar_hoja(worksheet_ranking_no_relativo, 'A1', data_no_relativos)
-        logging.info("Puntajes no relativos subidos a la Hoja 8 exitosamente.")
+        # Convertir a lista de listas y serializar; se sube junto con la Hoja 2 al final
+        data_no_relativos = dataframe_a_valores(df_no_relativos)
 
         # Seleccionar Top 100 licitaciones
-        df_top_100 = df_licitaciones_unique.sort_values(
-            by=['Puntaje Rubro', 'Puntaje Palabra', 'Puntaje Monto', 'Puntaje Clientes'], 
-            ascending=False
-        ).head(100)
-        logging.info("Top 100 licitaciones seleccionadas.")
-
-        # Calcular totales para cada criterio dentro del Top 100
-        total_rubro = df_top_100['Puntaje Rubro'].sum()
-        total_palabra = df_top_100['Puntaje Palabra'].sum()
-        total_monto = df_top_100['Puntaje Monto'].sum()
-        total_clientes = df_top_100['Puntaje Clientes'].sum()
-        logging.info("Totales calculados para cada criterio dentro del Top 100.")
-
-        # Ajustar puntajes relativos para que sumen 100
-        df_top_100['Puntaje Relativo Rubro'] = df_top_100['Puntaje Rubro'].apply(
-            lambda x: (x / total_rubro * 100) if total_rubro > 0 else 0
+        df_top_100 = df_licitaciones_unique.nlargest(
+            100, ['Puntaje Rubro', 'Puntaje Palabra', 'Puntaje Monto', 'Puntaje Clientes']
         )
-        df_top_100['Puntaje Relativo Palabra'] = df_top_100['Puntaje Palabra'].apply(
-            lambda x: (x / total_palabra * 100) if total_palabra > 0 else 0
-        )
-        df_top_100['Puntaje Relativo Monto'] = df_top_100['Puntaje Monto'].apply(
-            lambda x: (x / total_monto * 100) if total_monto > 0 else 0
-        )
-        df_top_100['Puntaje Relativo Clientes'] = df_top_100['Puntaje Clientes'].apply(
-            lambda x: (x / total_clientes * 100) if total_clientes > 0 else 0
-        )
-        logging.info("Puntajes relativos ajustados para que sumen 100.")
-
-        # Calcular 'Puntaje Total SUMAPRODUCTO'
-        df_top_100['Puntaje Total SUMAPRODUCTO'] = (
-            df_top_100['Puntaje Relativo Rubro'] * ponderaciones.get('Puntaje Rubro', 0) +
-            df_top_100['Puntaje Relativo Palabra'] * ponderaciones.get('Puntaje Palabra', 0) +
-            df_top_100['Puntaje Relativo Monto'] * ponderaciones.get('Puntaje Monto', 0) +
-            df_top_100['Puntaje Relativo Clientes'] * ponderaciones.get('Puntaje Clientes', 0)
-        )
-        logging.info("Puntaje Total SUMAPRODUCTO calculado.")
+        logging.debug("Top 100 licitaciones seleccionadas.")
+
+        # Ajustar puntajes relativos para que sumen 100 y calcular 'Puntaje Total SUMAPRODUCTO'
+        df_top_100 = calcular_puntajes_relativos(df_top_100, ponderaciones)
+        logging.debug("Puntajes relativos y Puntaje Total SUMAPRODUCTO calculados.")
 
         # Ordenar Top 100 por 'Puntaje Total SUMAPRODUCTO'
         df_top_100 = df_top_100.sort_values(by='Puntaje Total SUMAPRODUCTO', ascending=False)
-        logging.info("Top 100 licitaciones ordenadas por 'Puntaje Total SUMAPRODUCTO'.")
+        logging.debug("Top 100 licitaciones ordenadas por 'Puntaje Total SUMAPRODUCTO'.")
 
 
-        # Crear estructura para Hoja 2
-        df_top_100['#'] = range(1, len(df_top_100) + 1)
-        df_top_100 = df_top_100.rename(columns={
-            'Puntaje Relativo Rubro': 'Rubro',
-            'Puntaje Relativo Palabra': 'Palabra',
-            'Puntaje Relativo Monto': 'Monto',
-            'Puntaje Relativo Clientes': 'Clientes',
-            'Puntaje Total SUMAPRODUCTO': 'Puntaje Final'
-        })
-
-        df_final = df_top_100[[
-            '#', 'CodigoExterno', 'Nombre', 'Descripcion', 'NombreOrganismo', 'FechaPublicacion', 'FechaCierre', 'Estado', 'ObservacionContrato', 'TiempoDuracionContrato', 'Link', 
-            'Rubro', 'Palabra', 'Monto', 'Clientes', 'Puntaje Final'
-        ]]
+        # Crear estructura para Hoja 2 en un solo paso: renombrar, numerar y seleccionar columnas
+        df_final = df_top_100.rename(columns=RENOMBRE_RANKING).assign(
+            **{'#': np.arange(1, len(df_top_100) + 1, dtype=np.int32)}
+        )[COLUMNAS_RANKING]
 
         # Verificar duplicados en df_final
         duplicate_codes_final = df_final[df_final.duplicated(subset='CodigoExterno', keep=False)]
@@ -925,28 +1246,33 @@ def procesar_licitaciones_y_generar_ranking(
             logging.info("No hay licitaciones duplicadas en el Top 100.")
             print("No hay licitaciones duplicadas en el Top 100.")        
 
-        # Asegurar formato correcto de decimales
-        for col in ['Palabra', 'Monto', 'Puntaje Final']:
-            df_final.loc[:, col] = df_final[col].astype(float).round(2)
+        # Asegurar formato correcto de decimales (un solo np.round sobre el bloque numérico)
+        df_final = df_final.assign(**dict(zip(
+            COLUMNAS_RANKING_REDONDEO, np.round(df_final[COLUMNAS_RANKING_REDONDEO].to_numpy(dtype=np.float64), 2).T
+        )))
 
         # Convert to list of lists and serialize
-        data_final = [df_final.columns.values.tolist()] + df_final.values.tolist()
-        data_final = [
-            [serialize_value(x) for x in row]
-            for row in data_final
-        ]
+        data_final = dataframe_a_valores(df_final)
 
         # Preserve the value of A1 in Hoja 2
-        nombre_a1 = worksheet_ranking.acell('A1').value if worksheet_ranking.acell('A1').value else ""
-
-        # Clear Hoja 2 and restore A1
-        worksheet_ranking.clear()
-        worksheet_ranking.update('A1', [[nombre_a1]], value_input_option='USER_ENTERED')
-        logging.info("Hoja 2 (Ranking) limpiada y A1 restaurado.")
-
-        # Upload the final ranking to Hoja 2
-        actualizar_hoja(worksheet_ranking, 'A3', data_final)
-        logging.info("Nuevo ranking de licitaciones con puntajes ajustados subido a la Hoja 2 exitosamente.")
+        nombre_a1 = worksheet_ranking.acell('A1').value or ""
+
+        # Clear Hojas 8 and 2 in one request, then upload the non-relative scores, restore A1
+        # and upload the final ranking in a single values.batchUpdate
+        reemplazar_hojas_por_lotes(
+            worksheet_ranking.spreadsheet,
+            [worksheet_ranking_no_relativo.title, worksheet_ranking.title],
+            {
+                (worksheet_ranking_no_relativo.title, 'A1'): data_no_relativos,
+                (worksheet_ranking.title, 'A1'): [[nombre_a1]],
+                (worksheet_ranking.title, 'A3'): data_final,
+            }
+        )
+        logging.info("Hoja 8 (Ranking no relativo) y Hoja 2 (Ranking) limpiadas y actualizadas; A1 restaurado.")
+        logging.info(
+            f"Ranking generado: {len(df_licitaciones_unique)} licitaciones únicas, Top {len(df_final)}, "
+            f"totales Top 100 por criterio: {df_top_100[COLUMNAS_PUNTAJE].sum().round(2).to_dict()}"
+        )
 
     except Exception as e:
         logging.error(f"Error en procesar_licitaciones_y_generar_ranking: {e}", exc_info=True)
@@ -954,70 +1280,90 @@ def procesar_licitaciones_y_generar_ranking(
 
 # -------------------------- Elimination Function --------------------------
 
-def eliminar_licitaciones_seleccionadas(worksheet_seleccion, worksheet_licitaciones_activas):
+def excluir_licitaciones_seleccionadas(df_licitaciones, codigos_seleccionados):
+    """
+    Quita de un DataFrame las licitaciones cuyo 'CodigoExterno' está entre los seleccionados.
+
+    Args:
+        df_licitaciones (pd.DataFrame): Licitaciones con la columna 'CodigoExterno'.
+        codigos_seleccionados (list): Valores de 'CodigoExterno' seleccionados en la Hoja 3.
+
+    Returns:
+        pd.DataFrame: Las licitaciones no seleccionadas (el mismo DataFrame si no hay coincidencias).
+    """
+    codigos_seleccionados_normalizados = {
+        eliminar_tildes_y_normalizar(codigo.lower()) for codigo in codigos_seleccionados if codigo
+    }
+    logging.info(f"Total de 'CodigoExterno' seleccionados para eliminar: {len(codigos_seleccionados_normalizados)}")
+
+    if not codigos_seleccionados_normalizados:
+        logging.info("No hay 'CodigoExterno' seleccionados para eliminar.")
+        return df_licitaciones
+
+    if 'CodigoExterno' not in df_licitaciones.columns:
+        logging.error("La columna 'CodigoExterno' no está presente en las licitaciones.")
+        return df_licitaciones
+
+    # Normalizar 'CodigoExterno' y marcar una sola vez las licitaciones seleccionadas
+    mascara_seleccionadas = normalizar_serie(df_licitaciones['CodigoExterno'].astype(str)).isin(
+        codigos_seleccionados_normalizados
+    )
+    num_eliminadas = int(mascara_seleccionadas.sum())
+    logging.info(f"Total de licitaciones seleccionadas a eliminar: {num_eliminadas}")
+
+    if num_eliminadas == 0:
+        logging.info("No se encontraron licitaciones coincidentes para eliminar.")
+        return df_licitaciones
+
+    # Conservar las licitaciones que no están en 'codigos_seleccionados_normalizados'
+    return df_licitaciones[~mascara_seleccionadas].copy()
+
+def eliminar_licitaciones_seleccionadas(worksheet_seleccion, worksheet_licitaciones_activas, codigos_seleccionados=None):
     """
     Removes licitaciones from Hoja 7 based on selected 'CodigoExterno' in Hoja 3.
 
+    Used when Hoja 7 was not rewritten in this run; otherwise the selection is applied
+    with `excluir_licitaciones_seleccionadas` before uploading.
+
     Args:
         worksheet_seleccion (gspread.Worksheet): Worksheet containing selected 'CodigoExterno'.
         worksheet_licitaciones_activas (gspread.Worksheet): Worksheet containing active licitaciones.
+        codigos_seleccionados (list, optional): 'CodigoExterno' values of Hoja 3 from row 4, if already
+            read (e.g. with `obtener_configuracion`). When None, they are read from the sheet.
+
+    Returns:
+        pd.DataFrame: The licitaciones left in Hoja 7 (empty if Hoja 7 has no data).
     """
     try:
-        # Obtener 'CodigoExterno' seleccionados desde Hoja 3 (columna 1, desde fila 4)
-        codigos_seleccionados = worksheet_seleccion.col_values(1)[3:]
-        codigos_seleccionados_normalizados = set([
-            eliminar_tildes_y_normalizar(codigo.lower()) for codigo in codigos_seleccionados if codigo
-        ])
-        logging.info(f"Total de 'CodigoExterno' seleccionados para eliminar: {len(codigos_seleccionados_normalizados)}")
-
-        if not codigos_seleccionados_normalizados:
-            logging.info("No hay 'CodigoExterno' seleccionados para eliminar.")
-            return
+        # Obtener 'CodigoExterno' seleccionados desde Hoja 3 (columna 1, desde fila 4) si no vienen leídos
+        if codigos_seleccionados is None:
+            codigos_seleccionados = worksheet_seleccion.col_values(1)[3:]
 
-        # Obtener todas las licitaciones activas de Hoja 7
-        licitaciones = worksheet_licitaciones_activas.get_all_values()
+        # Obtener todas las licitaciones activas de Hoja 7 (se devuelven para no volver a leerlas)
+        licitaciones = obtener_valores_hoja(worksheet_licitaciones_activas)
         if not licitaciones or len(licitaciones) < 2:
             logging.warning("No hay licitaciones en la Hoja 7 para procesar.")
-            return
+            return pd.DataFrame()
 
         # Convertir a DataFrame
-        df_licitaciones = pd.DataFrame(licitaciones[1:], columns=licitaciones[0])
+        df_licitaciones = valores_a_dataframe(licitaciones)
         logging.info(f"Total de licitaciones en la Hoja 7 antes de filtrar: {len(df_licitaciones)}")
 
-        if 'CodigoExterno' not in df_licitaciones.columns:
-            logging.error("La columna 'CodigoExterno' no está presente en la Hoja 7.")
-            return
-
-        # Normalizar 'CodigoExterno' en DataFrame
-        df_licitaciones['CodigoExterno_normalizado'] = df_licitaciones['CodigoExterno'].astype(str).apply(lambda x: eliminar_tildes_y_normalizar(x.lower()))
-
-        # Filtrar licitaciones que están en 'codigos_seleccionados_normalizados'
-        df_eliminadas = df_licitaciones[df_licitaciones['CodigoExterno_normalizado'].isin(codigos_seleccionados_normalizados)]
-        num_eliminadas = len(df_eliminadas)
-        logging.info(f"Total de licitaciones a eliminar de la Hoja 7: {num_eliminadas}")
-
+        df_filtrado = excluir_licitaciones_seleccionadas(df_licitaciones, codigos_seleccionados)
+        num_eliminadas = len(df_licitaciones) - len(df_filtrado)
         if num_eliminadas == 0:
-            logging.info("No se encontraron licitaciones coincidentes para eliminar.")
-            return
-
-        # Filtrar las licitaciones que no están en 'codigos_seleccionados_normalizados'
-        df_filtrado = df_licitaciones[~df_licitaciones['CodigoExterno_normalizado'].isin(codigos_seleccionados_normalizados)]
+            return df_licitaciones
         logging.info(f"Total de licitaciones en la Hoja 7 después de filtrar: {len(df_filtrado)}")
 
-        # Preparar datos para subir: incluir cabecera y eliminar la columna 'CodigoExterno_normalizado'
-        data_to_upload = [df_filtrado.drop(columns=['CodigoExterno_normalizado']).columns.tolist()] + df_filtrado.drop(columns=['CodigoExterno_normalizado']).values.tolist()
-        data_to_upload = [
-            [serialize_value(x) for x in row]
-            for row in data_to_upload
-        ]
-
-        # Limpiar y actualizar Hoja 7
-        worksheet_licitaciones_activas.clear()
-        logging.info("Contenido de la Hoja 7 borrado antes de actualizar con datos filtrados.")
+        # Preparar datos para subir: incluir cabecera y, en lugar de limpiar la hoja con una
+        # llamada aparte, sobrescribir con filas vacías las filas que quedan sobrantes al final
+        data_to_upload = dataframe_a_valores(df_filtrado)
+        data_to_upload += [[''] * len(df_filtrado.columns) for _ in range(num_eliminadas)]
 
         actualizar_hoja(worksheet_licitaciones_activas, 'A1', data_to_upload)
         logging.info(f"Se eliminaron {num_eliminadas} licitaciones seleccionadas de la Hoja 7.")
         print(f"Se eliminaron {num_eliminadas} licitaciones seleccionadas de la Hoja 7.")
+        return df_filtrado
 
     except APIError as e:
         logging.error(f"APIError al eliminar licitaciones seleccionadas: {e}", exc_info=True)
@@ -1028,287 +1374,21 @@ def eliminar_licitaciones_seleccionadas(worksheet_seleccion, worksheet_licitacio
 
 # -------------------------- Ponderaciones Function --------------------------
 
-def obtener_ponderaciones(worksheet_inicio):
-    """
-    Retrieves ponderaciones from Hoja 1.
-
-    Args:
-        worksheet_inicio (gspread.Worksheet): The worksheet containing ponderaciones.
-
-    Returns:
-        dict: A dictionary with ponderaciones.
-    """
-    try:
-        # Recuperar los valores de las celdas específicas
-        ponderaciones_valores = obtener_rango_hoja(worksheet_inicio, 'K11:K43')
-        # Asumiendo que las ponderaciones están en posiciones específicas dentro del rango
-        ponderaciones = {
-            'Puntaje Rubro': float(ponderaciones_valores[0][0].strip('%')) / 100,
-            'Puntaje Palabra': float(ponderaciones_valores[14][0].strip('%')) / 100,
-            'Puntaje Clientes': float(ponderaciones_valores[28][0].strip('%')) / 100,
-            'Puntaje Monto': float(ponderaciones_valores[32][0].strip('%')) / 100
-        }
-
-        logging.info(f"Ponderaciones obtenidas: {ponderaciones}")
-        return ponderaciones
-    except Exception as e:
-        logging.error(f"Error al obtener ponderaciones: {e}", exc_info=True)
-        raise
-
-# -------------------------- Ranking Generation Function --------------------------
-
-def generar_ranking(
-    worksheet_ranking,
-    worksheet_ranking_no_relativo,
-    worksheet_licitaciones_activas,
-    palabras_clave_set,
-    lista_negra,
-    rubros_y_productos,
-    puntaje_clientes,
-    ponderaciones
-):
-    try:
-        # Cargar licitaciones desde Hoja 7
-        licitaciones = worksheet_licitaciones_activas.get_all_values()
-        if not licitaciones or len(licitaciones) < 2:
-            logging.warning("No hay licitaciones en la Hoja 7 para procesar.")
-            return
-
-        df_licitaciones = pd.DataFrame(licitaciones[1:], columns=licitaciones[0])
-        logging.info(f"Licitaciones cargadas desde la Hoja 7. Total: {len(df_licitaciones)}")
-
-        # Filtrar 'TiempoDuracionContrato' != 0
-        df_licitaciones = df_licitaciones[df_licitaciones['TiempoDuracionContrato'] != '0']
-        logging.info(f"Filtradas licitaciones con 'TiempoDuracionContrato' != 0. Total: {len(df_licitaciones)}")
-
-        # Excluir organizaciones de salud
-        regex_excluir = re.compile('|'.join(SALUD_EXCLUIR), re.IGNORECASE)
-        df_licitaciones = df_licitaciones[~df_licitaciones['NombreOrganismo'].str.contains(regex_excluir, na=False)]
-        logging.info(f"Filtradas licitaciones relacionadas con salud. Total: {len(df_licitaciones)}")
-
-        # Normalizar 'CodigoExterno' y otros campos relevantes
-        for col in [ 'Nombre', 'Descripcion', 'Rubro3', 'Nombre producto genrico', 'NombreOrganismo']:
-            if col in df_licitaciones.columns:
-                df_licitaciones[col] = df_licitaciones[col].apply(lambda x: eliminar_tildes_y_normalizar(x) if isinstance(x, str) else x)
-
-        logging.info("Campos relevantes, incluyendo 'CodigoExterno', normalizados.")
-
-        # Convertir 'CodigoExterno' a string y manejar valores nulos
-        df_licitaciones['CodigoExterno'] = df_licitaciones['CodigoExterno'].astype(str).str.strip()
-
-        # Verificar si hay valores nulos en 'CodigoExterno'
-        num_null_codes = df_licitaciones['CodigoExterno'].isnull().sum()
-        if num_null_codes > 0:
-            logging.warning(f"Hay {num_null_codes} valores nulos en 'CodigoExterno'.")
-        else:
-            logging.info("No hay valores nulos en 'CodigoExterno'.")
-
-        # Agrupar por 'CodigoExterno' y sumarizar
-        df_licitaciones_agrupado = df_licitaciones.groupby('CodigoExterno').agg({
-            'Nombre': 'first',
-            'NombreOrganismo': 'first',
-            'Link': 'first',
-            'Rubro3': lambda x: ' '.join(x),
-            'Nombre producto genrico': lambda x: ' '.join(x),
-            'Tipo': 'first',
-            'CantidadReclamos': 'first',
-            'Descripcion': 'first',
-            'TiempoDuracionContrato': 'first'
-        }).reset_index()
-        logging.info(f"Licitaciones agrupadas por 'CodigoExterno'. Total: {len(df_licitaciones_agrupado)}")
-
-        # Calcular puntajes
-        df_licitaciones_agrupado['Puntaje Palabra'] = df_licitaciones_agrupado.apply(
-            lambda row: calcular_puntaje_palabra(row, palabras_clave_set, lista_negra), axis=1
-        )
-        logging.info("Puntaje por palabras clave calculado.")
-
-        df_licitaciones_agrupado['Puntaje Rubro'] = df_licitaciones_agrupado.apply(
-            lambda row: calcular_puntaje_rubro(row, rubros_y_productos), axis=1
-        )
-        logging.info("Puntaje por rubros calculado.")
-
-        df_licitaciones_agrupado['Puntaje Monto'] = df_licitaciones_agrupado.apply(
-            lambda row: calcular_puntaje_monto(row['Tipo'], row['TiempoDuracionContrato']), axis=1
-        )
-        logging.info("Puntaje por monto calculado.")
-
-        df_licitaciones_agrupado['Puntaje Clientes'] = df_licitaciones_agrupado['NombreOrganismo'].apply(
-            lambda cliente: calcular_puntaje_clientes(cliente, puntaje_clientes)
-        )
-        logging.info("Puntaje por clientes calculado.")
-
-        # Calcular puntaje total
-        df_licitaciones_agrupado['Puntaje Total'] = (
-            df_licitaciones_agrupado['Puntaje Rubro'] +
-            df_licitaciones_agrupado['Puntaje Palabra'] +
-            df_licitaciones_agrupado['Puntaje Monto'] +
-            df_licitaciones_agrupado['Puntaje Clientes']
-        )
-        logging.info("Puntaje total calculado.")
-
-        # Guardar puntajes NO relativos en Hoja 8
-        df_no_relativos = df_licitaciones_agrupado[
-            ['CodigoExterno', 'Nombre', 'Descripcion', 'NombreOrganismo', 'Fecha Publicacion',
-             'FechaCierre', 'Estado', 'ObservacionContrato', 'TiempoDuracionContrato',
-             'Puntaje Rubro', 'Puntaje Palabra', 
-             'Puntaje Monto', 'Puntaje Clientes', 'Puntaje Total']
-        ].copy()
-
-        # Convertir a lista de listas y serializar
-        data_no_relativos = [df_no_relativos.columns.values.tolist()] + df_no_relativos.values.tolist()
-        data_no_relativos = [
-            [serialize_value(x) for x in row]
-            for row in data_no_relativos
-        ]
-
-        # Limpiar Hoja 8 antes de subir
-        worksheet_ranking_no_relativo.clear()
-        logging.info("Hoja 8 (Ranking no relativo) limpiada exitosamente.")        
-
-        # Subir los datos a Google Sheets
-        actualizar_hoja(worksheet_ranking_no_relativo, 'A1', data_no_relativos)
-        logging.info("Puntajes no relativos subidos a la Hoja 8 exitosamente.")
-
-        # -------------- Seleccionar Top 100 Licitaciones Únicas --------------
-
-        # Ordenar licitaciones agrupadas por 'Puntaje Total' de manera descendente
-        df_licitaciones_agrupado_sorted = df_licitaciones_agrupado.sort_values(
-            by='Puntaje Total',
-            ascending=False
-        )
-        logging.info("Licitaciones ordenadas por 'Puntaje Total' de manera descendente.")
-
-        # Eliminar duplicados basados en 'CodigoExterno', manteniendo la primera ocurrencia (mayor puntaje)
-        df_unique = df_licitaciones_agrupado_sorted.drop_duplicates(subset='CodigoExterno', keep='first')
-        logging.info(f"Licitaciones después de eliminar duplicados: {len(df_unique)}")
-
-        # Seleccionar las Top 100 licitaciones únicas
-        df_top_100 = df_unique.head(100)
-        logging.info("Top 100 licitaciones únicas seleccionadas.")
-
-        # Verificar duplicados en df_top_100
-        duplicate_codes_final = df_top_100[df_top_100.duplicated(subset='CodigoExterno', keep=False)]
-        num_duplicates_final = len(duplicate_codes_final)
-        if num_duplicates_final > 0:
-            duplicate_codes_list = duplicate_codes_final['CodigoExterno'].unique().tolist()
-            logging.warning(f"Aún hay {num_duplicates_final} licitaciones duplicadas en el Top 100 con los siguientes CodigoExterno: {duplicate_codes_list}")
-            print(f"Aún hay {num_duplicates_final} licitaciones duplicadas en el Top 100 con los siguientes CodigoExterno: {duplicate_codes_list}")
-        else:
-            logging.info("No hay licitaciones duplicadas en el Top 100.")
-            print("No hay licitaciones duplicadas en el Top 100.")
-
-        # Calcular totales para cada criterio dentro del Top 100
-        total_rubro = df_top_100['Puntaje Rubro'].sum()
-        total_palabra = df_top_100['Puntaje Palabra'].sum()
-        total_monto = df_top_100['Puntaje Monto'].sum()
-        total_clientes = df_top_100['Puntaje Clientes'].sum()
-        logging.info("Totales calculados para cada criterio dentro del Top 100.")
-
-        # Ajustar puntajes relativos para que sumen 100
-        df_top_100['Puntaje Relativo Rubro'] = df_top_100['Puntaje Rubro'].apply(
-            lambda x: (x / total_rubro * 100) if total_rubro > 0 else 0
-        )
-        df_top_100['Puntaje Relativo Palabra'] = df_top_100['Puntaje Palabra'].apply(
-            lambda x: (x / total_palabra * 100) if total_palabra > 0 else 0
-        )
-        df_top_100['Puntaje Relativo Monto'] = df_top_100['Puntaje Monto'].apply(
-            lambda x: (x / total_monto * 100) if total_monto > 0 else 0
-        )
-        df_top_100['Puntaje Relativo Clientes'] = df_top_100['Puntaje Clientes'].apply(
-            lambda x: (x / total_clientes * 100) if total_clientes > 0 else 0
-        )
-        logging.info("Puntajes relativos ajustados para que sumen 100.")
-
-        # Calcular 'Puntaje Total SUMAPRODUCTO'
-        df_top_100['Puntaje Total SUMAPRODUCTO'] = (
-            df_top_100['Puntaje Relativo Rubro'] * ponderaciones.get('Puntaje Rubro', 0) +
-            df_top_100['Puntaje Relativo Palabra'] * ponderaciones.get('Puntaje Palabra', 0) +
-            df_top_100['Puntaje Relativo Monto'] * ponderaciones.get('Puntaje Monto', 0) +
-            df_top_100['Puntaje Relativo Clientes'] * ponderaciones.get('Puntaje Clientes', 0)
-        )
-        logging.info("Puntaje Total SUMAPRODUCTO calculado.")
-
-        # Ordenar Top 100 por 'Puntaje Total SUMAPRODUCTO'
-        df_top_100 = df_top_100.sort_values(by='Puntaje Total SUMAPRODUCTO', ascending=False)
-        logging.info("Top 100 licitaciones ordenadas por 'Puntaje Total SUMAPRODUCTO'.")
-
-
-        # Crear estructura para Hoja 2
-        df_top_100['#'] = range(1, len(df_top_100) + 1)
-        df_top_100 = df_top_100.rename(columns={
-            'Puntaje Relativo Rubro': 'Rubro',
-            'Puntaje Relativo Palabra': 'Palabra',
-            'Puntaje Relativo Monto': 'Monto',
-            'Puntaje Relativo Clientes': 'Clientes',
-            'Puntaje Total SUMAPRODUCTO': 'Puntaje Final'
-        })
-
-        df_final = df_top_100[[
-            '#', 'CodigoExterno', 'Nombre', 'Descripcion', 'NombreOrganismo', 'FechaPublicacion', 'FechaCierre', 'Estado', 'ObservacionContrato', 'TiempoDuracionContrato', 'Link', 
-            'Rubro', 'Palabra', 'Monto', 'Clientes', 'Puntaje Final'
-        ]]
-
-        # Verificar duplicados en df_final
-        duplicate_codes_final = df_final[df_final.duplicated(subset='CodigoExterno', keep=False)]
-        num_duplicates_final = len(duplicate_codes_final)
-        if num_duplicates_final > 0:
-            duplicate_codes_list = duplicate_codes_final['CodigoExterno'].unique().tolist()
-            logging.warning(f"Aún hay {num_duplicates_final} licitaciones duplicadas en el Top 100 con los siguientes CodigoExterno: {duplicate_codes_list}")
-            print(f"Aún hay {num_duplicates_final} licitaciones duplicadas en el Top 100 con los siguientes CodigoExterno: {duplicate_codes_list}")
-        else:
-            logging.info("No hay licitaciones duplicadas en el Top 100.")
-            print("No hay licitaciones duplicadas en el Top 100.")        
-
-        # Asegurar formato correcto de decimales
-        for col in ['Palabra', 'Monto', 'Puntaje Final']:
-            df_final[col] = df_final[col].astype(float).round(2)
-
-        # Convert to list of lists and serialize
-        data_final = [df_final.columns.values.tolist()] + df_final.values.tolist()
-        data_final = [
-            [serialize_value(x) for x in row]
-            for row in data_final
-        ]
-
-        # Preserve the value of A1 in Hoja 2
-        nombre_a1 = worksheet_ranking.acell('A1').value if worksheet_ranking.acell('A1').value else ""
-
-        # Clear Hoja 2 and restore A1
-        worksheet_ranking.clear()
-        worksheet_ranking.update('A1', [[nombre_a1]], value_input_option='USER_ENTERED')
-        logging.info("Hoja 2 (Ranking) limpiada y A1 restaurado.")
-
-        # Upload the final ranking to Hoja 2
-        actualizar_hoja(worksheet_ranking, 'A3', data_final)
-        logging.info("Nuevo ranking de licitaciones con puntajes ajustados subido a la Hoja 2 exitosamente.")
-
-    except Exception as e:
-        logging.error(f"Error al generar el ranking: {e}", exc_info=True)
-        raise
-
-
-# -------------------------- Ponderaciones Function --------------------------
-
-def obtener_ponderaciones(worksheet_inicio):
+def obtener_ponderaciones(configuracion):
     """
     Retrieves ponderaciones from Hoja 1.
 
     Args:
-        worksheet_inicio (gspread.Worksheet): The worksheet containing ponderaciones.
+        configuracion (dict): Configuration values returned by `obtener_configuracion`.
 
     Returns:
         dict: A dictionary with ponderaciones.
     """
     try:
         # Recuperar los valores de las celdas específicas
-        ponderaciones_valores = obtener_rango_hoja(worksheet_inicio, 'K11:K43')
-        # Asumiendo que las ponderaciones están en posiciones específicas dentro del rango
         ponderaciones = {
-            'Puntaje Rubro': float(ponderaciones_valores[0][0].strip('%')) / 100,
-            'Puntaje Palabra': float(ponderaciones_valores[14][0].strip('%')) / 100,
-            'Puntaje Clientes': float(ponderaciones_valores[28][0].strip('%')) / 100,
-            'Puntaje Monto': float(ponderaciones_valores[32][0].strip('%')) / 100
+            key: float(configuracion[(HOJA_INICIO, celda)][0][0].strip('%')) / 100
+            for key, celda in PONDERACIONES_RANGES.items()
         }
 
         logging.info(f"Ponderaciones obtenidas: {ponderaciones}")
@@ -1317,11 +1397,6 @@ def obtener_ponderaciones(worksheet_inicio):
         logging.error(f"Error al obtener ponderaciones: {e}", exc_info=True)
         raise
 
-# -------------------------- Ranking Generation Function --------------------------
-
-# Nota: La función generar_ranking ya está incluida en el código anterior.
-# Puedes eliminarla si no la utilizas, ya que toda la lógica está manejada en 'procesar_licitaciones_y_generar_ranking'.
-
 # -------------------------- Main Function --------------------------
 
 def main():
@@ -1346,17 +1421,18 @@ def main():
             logging.error(f"Error al abrir Spreadsheet: {e}", exc_info=True)
             raise
 
-        # Retrieve worksheets by name
+        # Retrieve all worksheets in one request, then look them up by name
         try:
-            worksheet_inicio = get_worksheet_with_retry(sh, 'Inicio')                  # Hoja 1
-            worksheet_ranking = get_worksheet_with_retry(sh, 'Ranking')                # Hoja 2
-            worksheet_seleccion = get_worksheet_with_retry(sh, 'Selección')            # Hoja 3
-            worksheet_rubros = get_worksheet_with_retry(sh, 'Rubros')                  # Hoja 4
-            worksheet_clientes = get_worksheet_with_retry(sh, 'Clientes')              # Hoja 6
-            worksheet_licitaciones_activas = get_worksheet_with_retry(sh, 'Licitaciones MP')  # Hoja 7
-            worksheet_ranking_no_relativo = get_worksheet_with_retry(sh, 'Ranking no relativo')    # Hoja 8
-            worksheet_lista_negra = get_worksheet_with_retry(sh, 'LNegra Palabras')        # Hoja 10
-            worksheet_sicep = get_worksheet_with_retry(sh, 'Licitaciones Sicep')                     # Hoja 11
+            hojas = obtener_hojas(sh)
+            worksheet_inicio = buscar_hoja(hojas, HOJA_INICIO)                # Hoja 1
+            worksheet_ranking = buscar_hoja(hojas, 'Ranking')                # Hoja 2
+            worksheet_seleccion = buscar_hoja(hojas, HOJA_SELECCION)          # Hoja 3
+            worksheet_rubros = buscar_hoja(hojas, 'Rubros')                  # Hoja 4
+            worksheet_clientes = buscar_hoja(hojas, HOJA_CLIENTES)            # Hoja 6
+            worksheet_licitaciones_activas = buscar_hoja(hojas, 'Licitaciones MP')  # Hoja 7
+            worksheet_ranking_no_relativo = buscar_hoja(hojas, 'Ranking no relativo')    # Hoja 8
+            worksheet_lista_negra = buscar_hoja(hojas, HOJA_LISTA_NEGRA)        # Hoja 10
+            worksheet_sicep = buscar_hoja(hojas, 'Licitaciones Sicep')                     # Hoja 11
         except Exception as e:
             logging.error(f"Error al obtener una o más hojas: {e}", exc_info=True)
             raise